@@ -24,6 +24,19 @@ DOCUMENTATION = '''
         default: inventory_hostname
         vars:
           - name: ansible_host
+      low_latency:
+        description:
+          - Ask the kernel to deliver serial data with minimal delay
+          - Only effective on Linux hosts, silently ignored elsewhere
+        default: True
+        type: boolean
+        ini:
+          - section: defaults
+            key: serial_low_latency
+        env:
+          - name: ANSIBLE_SERIAL_LOW_LATENCY
+        vars:
+          - name: ansible_serial_low_latency
       serial_port:
         description: Serial port to connect to
         default: /dev/ttyS0
@@ -37,7 +50,7 @@ DOCUMENTATION = '''
       payload_size:
         description:
           - bytesize of payloads on write channel
-        default: 512
+        default: 4096
         ini:
           - section: defaults
             key: payload_size
@@ -45,6 +58,17 @@ DOCUMENTATION = '''
           - name: ANSIBLE_SERIAL_PAYLOAD_SIZE
         vars:
           - name: ansible_serial_payload_size
+      rtscts:
+        description: Enable hardware (RTS/CTS) flow control
+        default: False
+        type: boolean
+        ini:
+          - section: defaults
+            key: serial_rtscts
+        env:
+          - name: ANSIBLE_SERIAL_RTSCTS
+        vars:
+          - name: ansible_serial_rtscts
       remote_user:
         description:
           - User name with which to login to the remote server, normally set by the remote_user keyword
@@ -58,15 +82,25 @@ DOCUMENTATION = '''
         vars:
           - name: ansible_user
 '''
+import array
 import base64
-import dataclasses
+import fcntl
 import io
-import queue
+import os
 import re
+import select
 import serial
-import threading
 import time
 
+# use the SIMD-accelerated base64 implementation when available
+try:
+    import pybase64
+    b64encode = pybase64.b64encode
+    b64decode = pybase64.b64decode
+except ImportError:
+    b64encode = base64.b64encode
+    b64decode = base64.b64decode
+
 import ansible.constants as C
 from ansible.plugins.connection import ConnectionBase
 from ansible.errors import AnsibleError
@@ -74,12 +108,45 @@ from ansible.utils.display import Display
 
 display = Display()
 
-# TODO remove message dataclass
-@dataclasses.dataclass
-class Message:
-    '''Message to use in write queue'''
-    data: 'typing.Any'
-    is_raw: bool = False
+# linux serial_struct ioctls, as used by `setserial low_latency`
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 0x2000
+
+# http://ascii-table.com/ansi-escape-sequences-vt-100.php
+# 7-bit C1 ANSI sequences
+ANSI_SEQUENCE = re.compile(rb'''
+    \x1B  # ESC
+    (?:   # 7-bit C1 Fe (except CSI)
+        [@-Z\\-_]
+    |     # or [ for CSI, followed by a control sequence
+        \[
+        [0-?]*  # Parameter bytes
+        [ -/]*  # Intermediate bytes
+        [@-~]?   # Final byte
+    )
+''', re.VERBOSE)
+
+# known prompts, matched in a single pass; the group name that matched
+# is the shell type
+PROMPT_RE = re.compile(
+        rb'(?P<login> login: $)'
+        rb'|(?P<password>^Password: $)'
+        rb'|(?P<shell>[\$#] $)')
+
+# output of a low-level command, between its two delimiters; the start
+# delimiter may be glued to a still-unterminated prompt, so anything but
+# a newline is allowed before it on its line - the echo of the command
+# itself still cannot match since its delimiter is followed by '";', not
+# a line end
+CMD_OUTPUT_RE = re.compile(
+        rb'^[^\n]*?<<--START-CMD-(?P<d>[A-Z]+)-->>\r?\n'
+        rb'(?P<out>.*?)'
+        rb'^<<--END-CMD-(?P=d)-->>',
+        re.DOTALL | re.MULTILINE)
+
+# return-code marker separating stdout from stderr in exec_command output
+RC_RE = re.compile(rb'^<<--RC-->>(\d+)<<--RC-->>')
 
 class Connection(ConnectionBase):
     ''' Serial based connections '''
@@ -105,21 +172,11 @@ class Connection(ConnectionBase):
 
         self.host = self._play_context.remote_addr
 
-        self.stdout = io.BytesIO()
-        self.stderr = io.BytesIO()
-
         self.ser = serial.Serial()
 
         self.is_connected = False
-        self.ps1 = None
-        # TODO improve clarity
-        self.q = {a: queue.Queue() for a in ['read', 'write']}
-
-    def __del__(self):
-        if isinstance(self.stdout, io.BytesIO):
-            self.stdout.close()
-        if isinstance(self.stderr, io.BytesIO):
-            self.stderr.close()
+        # partial line received but not consumed yet
+        self._rx = bytearray()
 
     def _connect(self):
         ''' connect to the serial device '''
@@ -127,22 +184,19 @@ class Connection(ConnectionBase):
         if not self.is_connected:
             # get serial connection parameters
             self.ser.port = self.get_option('serial_port')
-            self.ser.baudrate = self.get_option('baudrate')
+            self.ser.baudrate = int(self.get_option('baudrate'))
+            self.ser.rtscts = self.get_option('rtscts')
             self.payload_size = int(self.get_option('payload_size'))
             self.ser.timeout = 0
+            # error out instead of hanging if the link stops accepting data
+            self.ser.write_timeout = self.read_timeout
 
             # initiate serial connection
             self.ser.open()
             self.is_connected = True
 
-            # declare stop event
-            self.stop_event = threading.Event()
-
-            # start read/write threads
-            self.t = {}
-            for a in ['read', 'write']:
-                self.t[a] = threading.Thread(target=getattr(self, a))
-                self.t[a].start()
+            if self.get_option('low_latency'):
+                self.set_low_latency()
 
         # login if necessary
         shell_type = self.req_shell_type()
@@ -151,48 +205,79 @@ class Connection(ConnectionBase):
 
         return self
 
+    def set_low_latency(self):
+        ''' ask the kernel to deliver serial data with minimal delay '''
+
+        # usb-serial adapters batch reads behind a 16ms latency timer by
+        # default, which dominates the round-trip time of short prompts
+        port = os.path.basename(self.ser.port)
+        try:
+            path = '/sys/bus/usb-serial/devices/{0}/latency_timer'.format(port)
+            with open(path, 'w') as f:
+                f.write('1')
+        except OSError:
+            pass
+
+        # same intent for non-usb uarts, equivalent of `setserial low_latency`
+        try:
+            buf = array.array('i', [0] * 64)
+            fcntl.ioctl(self.ser.fileno(), TIOCGSERIAL, buf)
+            # the flags field is the fifth int of struct serial_struct
+            buf[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(self.ser.fileno(), TIOCSSERIAL, buf)
+        except OSError:
+            pass
+
     def exec_command(self, cmd, in_data=None, sudoable=True):
         ''' run a command on the remote host'''
 
         super(Connection, self).exec_command(cmd, in_data=in_data, sudoable=sudoable)
 
-        # TODO factor these streams initialization
-        # open streams for stdout and stderr
-        if isinstance(self.stdout, io.BytesIO):
-            self.stdout.close()
-        if isinstance(self.stderr, io.BytesIO):
-            self.stderr.close()
-        self.stdout = io.BytesIO()
-        self.stderr = io.BytesIO()
+        # accumulate stdout and stderr as plain buffers, they are only
+        # wrapped in a stream on return
+        stdout = bytearray()
+        stderr = bytearray()
 
         display.vvv('>> {0}'.format(repr(cmd)), host=self.host)
 
-        # put stderr in a temporary file and store the return code in a variable
+        # put stderr in a temporary file, then report the return code and
+        # the stderr content in the same round-trip as the command itself;
+        # the marker is printed behind its own newline so it stays on its
+        # own line even when stdout does not end with one
         # TODO use ansible fn to find a suitable place to put it
-        stderr_remote = '~{user}/.ansible-serial.stderr'.format(user=self.user)
-        cmd = '2>{stderr} {cmd}; CODE=$?'.format(cmd=cmd, stderr=stderr_remote)
-
-        # send the cmd and get stdout
-        for m in self.low_cmd(cmd, 'out'):
-            self.stdout.write(m)
-            display.vvv('<< {0}'.format(m), host=self.host)
-
-        # get return code
-        cmd = 'echo "${CODE}"'
-        return_code = int(list(self.low_cmd(cmd, 'code'))[0])
-        display.vvv('<< {0}'.format(return_code))
+        stderr_remote = '~{user}/.ansible-serial.stderr'.format(user=self.user).encode()
+        cmd = (b'2>%s %s; rc=$?; printf \'\\n<<--RC-->>%%d<<--RC-->>\\n\' "$rc"; '
+               b'cat %s; rm %s') % (stderr_remote, cmd.encode(),
+                                    stderr_remote, stderr_remote)
+
+        # everything before the return-code marker is stdout, after is stderr
+        return_code = None
+        for m in self.low_cmd(cmd, 'all'):
+            if return_code is not None:
+                stderr += m
+                display.vvv('<< {0}'.format(m), host=self.host)
+                continue
+
+            rc = RC_RE.match(m)
+            if rc:
+                return_code = int(rc.group(1))
+                display.vvv('<< {0}'.format(return_code))
+            else:
+                stdout += m
+                display.vvv('<< {0}'.format(m), host=self.host)
 
-        # get stderr and remove temp file
-        cmd = 'cat {stderr}; rm {stderr}'.format(stderr=stderr_remote)
-        for m in self.low_cmd(cmd, 'err'):
-            self.stderr.write(m)
-            display.vvv('<< {0}'.format(m), host=self.host)
+        if return_code is None:
+            raise AnsibleError(
+                'return code marker not found in output of command {0}'.format(
+                    repr(cmd)))
 
-        # reset cursor on stdout and stderr streams
-        self.stdout.seek(0)
-        self.stderr.seek(0)
+        # drop the newline the marker printf put in front of itself
+        if stdout.endswith(b'\r\n'):
+            del stdout[-2:]
+        elif stdout.endswith(b'\n'):
+            del stdout[-1:]
 
-        return (return_code, self.stdout, self.stderr)
+        return (return_code, io.BytesIO(bytes(stdout)), io.BytesIO(bytes(stderr)))
 
     def put_file(self, in_path, out_path):
         ''' transfer a file from local to remote '''
@@ -202,31 +287,38 @@ class Connection(ConnectionBase):
         # TODO (in|out)_path sanitization (if not done already)
         display.vvv(u"PUT {0} TO {1}".format(in_path, out_path), host=self.host)
 
-        # cmd for every payload
-        #cmd_pre = bytes('head -c -1 >> \'{}\' <<\'<<eof>>\'\n'.format(out_path), 'utf-8')
-        #cmd_post = bytes('\n<<eof>>\n', 'utf-8')
-
-        # TODO truly calculate max pyload size
+        # stage the base64 payload in a temporary file on the remote
+        # TODO use ansible fn to find a suitable place to put it
+        tmp_remote = '~{user}/.ansible-serial.b64'.format(user=self.user)
 
-        cmd_pre = bytes('echo -n \'', 'utf-8')
-        cmd_post = bytes('\' | base64 -d >> {}\n'.format(out_path), 'utf-8')
+        # length of the base64 lines sent inside the heredoc, the tty
+        # line discipline caps input lines at 4096 bytes
+        line_len = 2048
 
-        # send start delimiter
-        # TODO add variable to lessen the length of $out_path
-        self.q['write'].put(Message('echo "<<--START-TR-->>"\n'))
+        # encode in large blocks, multiple of 3 so base64 emits no
+        # padding in the middle of the stream
+        block_size = 48 * 1024
 
+        # collect the whole payload with a single heredoc instead of one
+        # shell command round-trip per 512-byte chunk
+        self._write('cat > {tmp} <<\'<<--EOF-TR-->>\'\n'.format(tmp=tmp_remote))
         with open(in_path, 'rb') as f:
-            # split the file in payloads of < 512 bytes
-            while (b := f.read(510)):
-                # contruct the command and send it
-                cmd = Message(cmd_pre + base64.b64encode(b) + cmd_post)
-                self.q['write'].put(cmd)
-
-        # send end delimiter
-        self.q['write'].put(Message('echo "<<--END-TR-->>"\n'))
-
-        list(self.read_q_until(self.is_line("<<--START-TR-->>"), inclusive=True))
-        list(self.read_q_until(self.is_line("<<--END-TR-->>"), inclusive=False))
+            while (b := f.read(block_size)):
+                # slice the encoded block through a memoryview so the
+                # join below is the only copy made per block
+                b64 = memoryview(b64encode(b))
+                parts = [b64[i:i+line_len] for i in range(0, len(b64), line_len)]
+                # the trailing empty part makes join emit the last newline
+                parts.append(b'')
+                # hand the block over in one call, _write still splits
+                # the batch along payload_size
+                self._write(b'\n'.join(parts))
+        self._write('<<--EOF-TR-->>\n')
+
+        # decode on the remote, this single command round-trip also
+        # resynchronizes the stream after the heredoc echo
+        cmd = 'base64 -d {tmp} > {out}; rm {tmp}'.format(tmp=tmp_remote, out=out_path)
+        list(self.low_cmd(cmd, 'put'))
 
     def fetch_file(self, in_path, out_path):
         ''' copy a file from remote to local '''
@@ -252,38 +344,76 @@ class Connection(ConnectionBase):
 
         # logout from remote
         self.logout()
-        # trigger event to stop the read/write workers
-        self.stop_event.set()
-
-        # wait until threads have properly exited
-        for a in ['read', 'write']:
-            self.t[a].join()
 
         # close serial connection
         self.ser.close()
         self.is_connected = False
 
-    def read(self):
-        ''' read from the serial connection to the read queue '''
-        while not self.stop_event.wait(self.loop_interval):
-            for received in self.ser:
-                display.vvvv('<<<< {0}'.format(repr(received)))
-                self.q['read'].put(received)
+    def _read_message(self, deadline):
+        ''' return the next line (or stalled prompt) from the serial port
 
-    def write(self):
-        ''' write from the write queue to the serial connection '''
-        while not self.stop_event.wait(self.loop_interval):
-            if self.q['write'].qsize() > 0:
-                qm = self.q['write'].get()
+        Returns None when the deadline expires with nothing to deliver.
+        '''
+        # bind loop state to locals, attribute lookups add up in here
+        buf = self._rx
+        ser = self.ser
+        fd = ser.fileno()
+        interval = self.loop_interval
+        now = time.time
+        # copy of buf from the previous idle iteration, to detect stalls
+        stalled = None
 
-                display.vvvv('>>>> {0}'.format(repr(qm.data)))
-                bm = qm.data if type(qm.data) is bytes else bytes(qm.data, 'utf-8')
-
-                # split in smaller payloads
-                p_size = self.payload_size
-                #payloads = [bm[i:i+p_size] for i in range(0, len(bm), p_size)]
-                #for p in payloads:
-                self.ser.write(bm)
+        while True:
+            # a complete line may already be buffered
+            i = buf.find(b'\n')
+            if i >= 0:
+                m = bytes(buf[:i+1])
+                del buf[:i+1]
+                display.vvvv('<<<< {0}'.format(repr(m)))
+                return m
+
+            if now() >= deadline:
+                return None
+
+            # block until data arrives, with a timeout only to let
+            # stalled prompts through
+            rlist, _, _ = select.select([fd], [], [], interval)
+
+            if rlist:
+                # read everything available in one call instead of the
+                # byte-by-byte line iteration of pyserial
+                buf += ser.read(ser.in_waiting or 1)
+                stalled = None
+            elif buf and bytes(buf) == stalled:
+                # no newline and no new data for a full interval,
+                # the remote is likely waiting on a prompt
+                m = bytes(buf)
+                buf.clear()
+                display.vvvv('<<<< {0}'.format(repr(m)))
+                return m
+            else:
+                stalled = bytes(buf)
+
+    def _write(self, data):
+        ''' write data synchronously to the serial connection '''
+        display.vvvv('>>>> {0}'.format(repr(data)))
+        bm = data if isinstance(data, bytes) else data.encode()
+
+        # split in smaller payloads
+        p_size = self.payload_size
+        ser_write = self.ser.write
+        for i in range(0, len(bm), p_size):
+            # keep the inbound side drained: with no reader thread, a
+            # backed-up echo would flow-control block our own write
+            self._drain()
+            ser_write(bm[i:i+p_size])
+
+    def _drain(self):
+        ''' discard unread input, e.g. stale prompts or pending echo '''
+        ser = self.ser
+        while (n := ser.in_waiting):
+            ser.read(n)
+        self._rx.clear()
 
     def decoder(self):
         ''' b64 decoder with remainder for unbounded messages '''
@@ -291,60 +421,42 @@ class Connection(ConnectionBase):
 
         def d(b):
             nonlocal rm
-            # append the encoded data to the remainder
-            b = rm + b
-            # reset the remainder
-            rm = b''
-            # get the highest length multiple of 4
-            rm_len = len(b) % 4
-            if rm_len:
-                # right side is remaining
-                rm = b[-rm_len:]
-                # left side is decoded
-                b = b[:-rm_len]
-            return base64.b64decode(b)
+            # prepend the remainder only when there is one, the stream is
+            # usually aligned and the concat would be a wasted allocation
+            if rm:
+                b = rm + b
+                rm = b''
+            # length above the highest multiple of 4
+            extra = len(b) & 3
+            if extra:
+                # right side is remaining, left side is decoded
+                rm = b[-extra:]
+                b = b[:-extra]
+            return b64decode(b)
         return d
 
-    def read_q_until(self, break_condition, inclusive=False):
-        ''' read the queue until a specified condition '''
-        q = self.q['read']
-        t_start = time.time()
+    def read_until(self, break_condition, inclusive=False):
+        ''' read incoming messages until a specified condition '''
+        read_message = self._read_message
         timeout = self.read_timeout
+        deadline = time.time() + timeout
         while True:
-            if q.qsize() > 0:
-                # get the next message
-                m = q.get()
-
-                # yield the message and break the loop if needed
-                if inclusive: yield m
-                if break_condition(m):
-                    break
-                if not inclusive: yield m
-
-                # after receiving any message, reset the timeout
-                t_start = time.time()
-            else:
-                time.sleep(self.loop_interval)
-                if time.time() >= t_start + timeout:
-                    raise LookupError(
-                        'break_condition "{fn}" has not been met for {t} seconds'.format(
-                            fn=repr(break_condition),
-                            t=timeout
-                    ))
-
-    def is_prompt_line(self, m):
-        return m.startswith(self.ps1)
-
-    def is_line(self, line):
-        ''' compare a message with a specified line '''
-        def c(m):
-            if type(m) is bytes:
-                try:
-                    m = m.decode()
-                except(UnicodeDecodeError, AttributeError):
-                    return False
-            return m.rstrip() == line.rstrip()
-        return c
+            m = read_message(deadline)
+            if m is None:
+                raise LookupError(
+                    'break_condition "{fn}" has not been met for {t} seconds'.format(
+                        fn=repr(break_condition),
+                        t=timeout
+                ))
+
+            # yield the message and break the loop if needed
+            if inclusive: yield m
+            if break_condition(m):
+                break
+            if not inclusive: yield m
+
+            # after receiving any message, reset the timeout
+            deadline = time.time() + timeout
 
     def is_any_prompt(self, m):
         ''' return true if any type of prompt '''
@@ -352,93 +464,96 @@ class Connection(ConnectionBase):
 
     def low_cmd(self, cmd, delimiter):
         ''' send low-level command '''
-        # create delimiters
-        s_del = '<<--START-CMD-{0}-->>'.format(delimiter.upper())
-        e_del = '<<--END-CMD-{0}-->>'.format(delimiter.upper())
+        # create delimiters, directly as bytes
+        s_del = b'<<--START-CMD-%s-->>' % delimiter.upper().encode()
+        e_del = b'<<--END-CMD-%s-->>' % delimiter.upper().encode()
 
         # encapsulate command
-        cmd = 'echo "{s_del}"; {cmd};echo "{e_del}"\n'.format(
-                cmd=cmd,
-                s_del=s_del,
-                e_del=e_del)
-
-        # send commnd to queue
-        self.q['write'].put(Message(cmd))
-
-        # flush queue to starting delimiter
-        list(self.read_q_until(self.is_line(s_del), inclusive=True))
-        
-        # yield the output until the ending delimiter
-        for m in self.read_q_until(self.is_line(e_del)):
+        if not isinstance(cmd, bytes):
+            cmd = cmd.encode()
+        cmd = b'echo "%s"; %s;echo "%s"\n' % (s_del, cmd, e_del)
+
+        # send command
+        self._write(cmd)
+
+        # accumulate raw messages and find the delimited output with a
+        # single regex scan instead of a python callback per line
+        buf = bytearray()
+        read_message = self._read_message
+        search = CMD_OUTPUT_RE.search
+        timeout = self.read_timeout
+        deadline = time.time() + timeout
+        while True:
+            m = read_message(deadline)
+            if m is None:
+                raise LookupError(
+                    'delimiter "{e_del}" has not been received for {t} seconds'.format(
+                        e_del=e_del.decode(),
+                        t=timeout
+                ))
+            buf += m
+            # only scan the buffer when this line can complete the match,
+            # rescanning on every line would be quadratic in output size
+            if m.startswith(e_del):
+                match = search(buf)
+                if match:
+                    break
+            # after receiving any message, reset the timeout
+            deadline = time.time() + timeout
+
+        # yield the output line by line
+        for m in match.group('out').splitlines(keepends=True):
             yield m
 
     def req_shell_type(self):
         ''' make a request and return the shell type '''
         # send line-feed character
-        ctrl_j = chr(10)
-        self.q['write'].put(Message(ctrl_j))
+        self._write(b'\n')
 
         # wait until a prompt is found
-        m = list(self.read_q_until(self.is_any_prompt, inclusive=True))[-1]
+        m = list(self.read_until(self.is_any_prompt, inclusive=True))[-1]
 
         # return the shell type
         return self.get_shell_type(m)
 
     def get_shell_type(self, line):
         ''' return which shell is on the other side '''
-        # http://ascii-table.com/ansi-escape-sequences-vt-100.php
-        # 7-bit C1 ANSI sequences
-        ansi_sequence = re.compile(r'''
-            \x1B  # ESC
-            (?:   # 7-bit C1 Fe (except CSI)
-                [@-Z\\-_]
-            |     # or [ for CSI, followed by a control sequence
-                \[
-                [0-?]*  # Parameter bytes
-                [ -/]*  # Intermediate bytes
-                [@-~]?   # Final byte
-            )
-        ''', re.VERBOSE)
-
         ## end with ANSI CPR (Response to cursor position request)
         #ansi_end_CPR = r'\x1B\[\d+;\d+R$'
 
-        escaped_line = line.decode('unicode_escape')
-        # remove ANSI sequences
-        clean_line = ansi_sequence.sub('', escaped_line)
+        # remove ANSI sequences, working on the raw bytes directly
+        clean_line = ANSI_SEQUENCE.sub(b'', line)
 
-        if re.search(' login: $', clean_line):
-            return 'login'
-
-        elif re.search('^Password: $', clean_line):
-            return 'password'
-
-        elif re.search('(\$|#) $', clean_line):
-            self.ps1 = bytes(line.decode().rstrip('\n'), 'utf-8')
-            return 'shell'
-
-        else:
+        prompt = PROMPT_RE.search(clean_line)
+        if prompt is None:
             return None
 
+        return prompt.lastgroup
+
     def login(self):
-        self.q['write'].put(Message('{cmd}{end}'.format(cmd=self.user, end='\n')))
+        self._write(self.user.encode() + b'\n')
 
         # read the last line
-        ll = list(self.read_q_until(self.is_any_prompt, inclusive=True))[-1]
+        ll = list(self.read_until(self.is_any_prompt, inclusive=True))[-1]
         shell_type = self.get_shell_type(ll)
 
         if shell_type == 'password':
-            self.q['write'].put(Message('{cmd}{end}'.format(cmd=self.passwd, end='\n')))
-            #time.sleep(5)
-            shell_type = self.req_shell_type()
+            self._write(self.passwd.encode() + b'\n')
+            # the shell prints its prompt on its own after a successful
+            # login, wait for it instead of probing with another newline
+            try:
+                ll = list(self.read_until(self.is_any_prompt, inclusive=True))[-1]
+                shell_type = self.get_shell_type(ll)
+            except LookupError:
+                shell_type = self.req_shell_type()
 
         if shell_type != 'shell':
             raise AnsibleError('Cannot login')
 
 
     def logout(self):
-        ctrl_d = chr(4)
-        self.q['write'].put(Message(ctrl_d))
+        # send end-of-transmission character
+        self._write(b'\x04')
 
         if self.req_shell_type() == 'login':
             display.v('Sucessful logout')